@@ -1,18 +1,26 @@
 import asyncio
+import threading
 import numpy as np
 import sounddevice as sd
 
 class AudioPlayer:
-    def __init__(self, stream_handler, sample_rate=48000, buffer_size=1024):
+    def __init__(self, stream_handler, sample_rate=48000, buffer_size=1024, ring_blocks=16):
         self.stream_handler = stream_handler
         self.sample_rate = sample_rate
         self.buffer_size = buffer_size
         self.playing = False
+        # Single-producer/single-consumer ring: the asyncio producer only
+        # advances _write_pos, the realtime callback only advances _read_pos.
+        self._ring = np.zeros(buffer_size * ring_blocks, dtype=np.int16)
+        self._write_pos = 0
+        self._read_pos = 0
+        self._write_lock = threading.Lock()
 
     async def start(self):
         self.playing = True
+        producer = asyncio.create_task(self._producer())
         try:
-            async with sd.OutputStream(
+            with sd.OutputStream(
                 samplerate=self.sample_rate,
                 blocksize=self.buffer_size,
                 dtype='int16',
@@ -23,20 +31,41 @@ class AudioPlayer:
                     await asyncio.sleep(0.1)
         except Exception as e:
             print(f"Audio output error: {e}")
+        finally:
+            producer.cancel()
 
     def stop(self):
         self.playing = False
 
+    async def _producer(self):
+        while self.playing:
+            audio = await self.stream_handler.get_audio_chunk()
+            if audio is not None:
+                self._write(audio)
+
+    def _write(self, audio):
+        size = len(self._ring)
+        with self._write_lock:
+            w = self._write_pos
+            free = size - (w - self._read_pos)
+            n = min(len(audio), free)
+            if n < len(audio):
+                print(f"Playback ring full, dropping {len(audio) - n} samples")
+            start = w % size
+            first = min(n, size - start)
+            self._ring[start:start + first] = audio[:first]
+            self._ring[:n - first] = audio[first:n]
+            # Publish only after the samples are in place
+            self._write_pos = w + n
+
     def callback(self, outdata, frames, time_info, status):
-        try:
-            audio = asyncio.run_coroutine_threadsafe(
-                self.stream_handler.get_audio_chunk(),
-                asyncio.get_event_loop()
-            ).result(timeout=0.05)
-            if audio is None:
-                outdata.fill(0)
-            else:
-                outdata[:, 0] = audio[:frames]
-        except Exception as e:
+        size = len(self._ring)
+        r = self._read_pos
+        if self._write_pos - r < frames:
             outdata.fill(0)
-            print(f"Playback callback error: {e}")
\ No newline at end of file
+            return
+        start = r % size
+        first = min(frames, size - start)
+        outdata[:first, 0] = self._ring[start:start + first]
+        outdata[first:frames, 0] = self._ring[:frames - first]
+        self._read_pos = r + frames
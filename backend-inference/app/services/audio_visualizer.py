@@ -1,7 +1,7 @@
 import numpy as np
-import matplotlib.pyplot as plt
+import pyqtgraph as pg
+from pyqtgraph.Qt import QtCore
 import threading
-import time
 
 class AudioVisualizer:
     def __init__(self, stream_handler, interval=0.1):
@@ -13,6 +13,11 @@ class AudioVisualizer:
         self.stream_handler = stream_handler
         self.interval = interval
         self.running = False
+        # Reused for every frame so the render loop doesn't allocate
+        self._buf = np.zeros(self.stream_handler.chunk_size, dtype=np.float32)
+        self._x = None
+        self._app = None
+        self._curve = None
 
     def start(self):
         self.running = True
@@ -22,26 +27,35 @@ class AudioVisualizer:
         self.running = False
 
     def _update_loop(self):
-        plt.ion()
-        fig, ax = plt.subplots()
-        x = np.linspace(0, self.stream_handler.chunk_size / self.stream_handler.sample_rate, self.stream_handler.chunk_size)
-        line, = ax.plot(x, np.zeros_like(x))
-        ax.set_ylim([-1.1, 1.1])
-        ax.set_xlim([0, x[-1]])
-        ax.set_xlabel('Time (seconds)')
-        ax.set_ylabel('Amplitude')
-        ax.set_title('Live Audio Waveform')
-
-        while self.running:
-            chunk = self.stream_handler.get_chunk()
-            if chunk is not None and len(chunk) > 0:
-                samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float32) / 32768.0
-                if len(samples) < self.stream_handler.chunk_size:
-                    samples = np.pad(samples, (0, self.stream_handler.chunk_size - len(samples)))
-                line.set_ydata(samples)
-                fig.canvas.draw()
-                fig.canvas.flush_events()
-            time.sleep(self.interval)
-
-        plt.ioff()
-        plt.close()
+        chunk_size = self.stream_handler.chunk_size
+        self._x = np.linspace(0, chunk_size / self.stream_handler.sample_rate, chunk_size)
+
+        self._app = pg.mkQApp("Live Audio Waveform")
+        win = pg.plot(title='Live Audio Waveform')
+        win.setYRange(-1.1, 1.1)
+        win.setXRange(0, self._x[-1])
+        win.setLabel('bottom', 'Time (seconds)')
+        win.setLabel('left', 'Amplitude')
+        self._curve = win.plot(self._x, self._buf, pen='y')
+
+        timer = QtCore.QTimer()
+        timer.timeout.connect(self._on_tick)
+        timer.start(int(self.interval * 1000))
+
+        # Blocks until _on_tick sees stop() and quits the Qt event loop
+        self._app.exec_()
+        timer.stop()
+        win.close()
+
+    def _on_tick(self):
+        if not self.running:
+            self._app.quit()
+            return
+
+        chunk = self.stream_handler.get_chunk()
+        if chunk is not None and len(chunk) > 0:
+            n = min(len(chunk) // 2, len(self._buf))
+            samples = np.frombuffer(chunk, dtype=np.int16, count=n)
+            np.multiply(samples, np.float32(1.0 / 32768.0), out=self._buf[:n], dtype=np.float32)
+            self._buf[n:] = 0.0
+            self._curve.setData(x=self._x, y=self._buf, skipFiniteCheck=True)
@@ -3,10 +3,12 @@ import websockets
 import numpy as np
 
 class AudioStreamHandler:
-    def __init__(self, uri: str):
+    def __init__(self, uri: str, batch_samples: int = 1024, queue_maxsize: int = 32):
         self.uri = uri
+        self.batch_samples = batch_samples
         self.connected = False
-        self.audio_queue = asyncio.Queue()
+        # Bounded so a slow consumer applies backpressure to the websocket reader
+        self.audio_queue = asyncio.Queue(maxsize=queue_maxsize)
         self.stop_signal = False
 
     async def connect(self):
@@ -23,17 +25,30 @@ class AudioStreamHandler:
                 await asyncio.sleep(5)  # Wait before retrying
 
     async def _listen(self, websocket):
+        # Coalesce small frames into one contiguous chunk per queue put
+        frames = []
+        total = 0
         try:
             async for message in websocket:
                 if isinstance(message, bytes):
                     samples = np.frombuffer(message, dtype=np.int16)
-                    await self.audio_queue.put(samples)
+                    frames.append(samples)
+                    total += samples.size
+                    if total >= self.batch_samples:
+                        await self.audio_queue.put(np.concatenate(frames))
+                        frames.clear()
+                        total = 0
         except websockets.ConnectionClosed:
             print("[AudioStreamHandler] Connection closed.")
         except Exception as e:
             print(f"[AudioStreamHandler] Listen error: {e}")
         finally:
             self.connected = False
+            if frames:
+                try:
+                    self.audio_queue.put_nowait(np.concatenate(frames))
+                except asyncio.QueueFull:
+                    pass
 
     async def get_audio_chunk(self):
         return await self.audio_queue.get()